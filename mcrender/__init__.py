@@ -16,27 +16,35 @@ __version__          = "1.0.0"
 # ==================================================================================================
 
 
-from typing import Optional
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
-from functools import lru_cache
-import time
+from functools import partial
+import atexit
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import subprocess
 import os
 import shutil
-from tempfile import TemporaryDirectory
-from configparser import ConfigParser
+import stat
+from tempfile import TemporaryDirectory, mkstemp
 
 import platformdirs
-from PIL import Image
+# Pillow and asyncio are imported where they are used: they are slow to import, and most calls
+# don't need them.
 
 from mcrender._util import eprint, move
 
 
-_SCRIPT_DIR          = os.path.dirname(os.path.realpath(__file__))
-_BLENDER_BLEND_PATH  = f"{_SCRIPT_DIR}/_data/blender/mineways-isometric.blend"
-_BLENDER_SCRIPT_PATH = f"{_SCRIPT_DIR}/_data/blender/mineways-isometric.py.txt"
-_DEFAULT_CONFIG_PATH = f"{_SCRIPT_DIR}/_data/default-config.conf"
-CONFIG_PATH          = os.path.join(platformdirs.user_config_dir("mcrender", ensure_exists=True), "config.conf")
+_SCRIPT_DIR          = os.path.dirname(os.path.abspath(__file__))
+_BLENDER_BLEND_PATH  = os.path.join(_SCRIPT_DIR, "_data", "blender", "mineways-isometric.blend")
+_BLENDER_SCRIPT_PATH = os.path.join(_SCRIPT_DIR, "_data", "blender", "mineways-isometric.py.txt")
+CONFIG_PATH          = os.path.join(platformdirs.user_config_dir("mcrender"), "config.conf")
+_RENDER_CACHE_DIR    = os.path.join(platformdirs.user_cache_dir("mcrender"), "renders")
+
+_RENDER_CACHE_DEFAULT_MAX_MB = 512
 
 _DIMENSION_ID_TO_MINEWAYS_NAME = {
     "overworld":  "Overworld",
@@ -47,6 +55,14 @@ _DIMENSION_ID_TO_MINEWAYS_NAME = {
 }
 DIMENSIONS = list(_DIMENSION_ID_TO_MINEWAYS_NAME.keys())
 
+_DIMENSION_ID_TO_REGION_DIR = {
+    "overworld":  "region",
+    "the_nether": "DIM-1/region",
+    "nether":     "DIM-1/region",
+    "the_end":    "DIM1/region",
+    "end":        "DIM1/region"
+}
+
 
 # --------------------------------------------------------------------------------------------------
 # Exception classes
@@ -96,7 +112,19 @@ class OutputFileExistsError(MCRenderError):
 # Config file
 
 
-@dataclass
+_DEFAULT_CONFIG = (
+    b"# Command to run Mineways\n"
+    b"# Mineways is Windows-only, so if you're not on Windows, you will need wine\n"
+    b"# (https://www.winehq.org/) to run it. In that case, an example command would be\n"
+    b"# \"wine /path/to/Mineways.exe\".\n"
+    b"mineways-cmd = mineways\n"
+    b"\n"
+    b"# Command to run Blender\n"
+    b"blender-cmd = blender\n"
+)
+
+
+@dataclass(frozen=True)
 class _Config:
     mineways_cmd: Optional[str] = "mineways"
     blender_cmd:  Optional[str] = "blender"
@@ -110,38 +138,141 @@ def ensure_config_file():
 
     if not os.path.isfile(CONFIG_PATH):
         try:
-            shutil.copy2(_DEFAULT_CONFIG_PATH, CONFIG_PATH)
+            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+            # "x" mode: if another process created the file in the meantime, keep theirs.
+            with open(CONFIG_PATH, "xb") as file:
+                file.write(_DEFAULT_CONFIG)
+        except FileExistsError:
+            pass
         except OSError as e:
             raise ConfigAccessError(f"Could not create default config file at {CONFIG_PATH}") from e
 
 
-@lru_cache(maxsize=None)
-def _read_config_file():
+def _parse_config(lines: Iterable[str]) -> Dict[str, str]:
+    """Parses config file lines of the form `<key> = <value>` (or `<key>: <value>`).
+
+    Empty lines and lines starting with # or ; are skipped. Keys are case-insensitive. An indented
+    line continues the value of the previous key; the lines are joined with newlines.
+
+    The file may contain INI-style section headers. Only keys before the first header and keys in a
+    [DEFAULT] section are returned.
+
+    Raises a ValueError if a line has none of these forms.
+    """
+
+    values = {}
+    section_values = values
+    key = None
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if key is not None and line[0].isspace():
+            section_values[key] += "\n" + stripped
+            continue
+        if stripped[0] == "[" and stripped[-1] == "]":
+            section_values = values if stripped == "[DEFAULT]" else {}
+            key = None
+            continue
+        separator = min((i for i in (stripped.find("="), stripped.find(":")) if i > 0), default=-1)
+        if separator == -1:
+            raise ValueError(f"Line {line_number} is not of the form '<key> = <value>': {repr(stripped)}")
+        key = stripped[:separator].strip().lower()
+        section_values[key] = stripped[separator + 1:].strip()
+    return values
+
+
+# The last parsed config, together with the (mtime, size) of the config file it was parsed from.
+_config_cache: Optional[Tuple[Tuple[int, int], _Config]] = None
+
+
+def _read_config_file() -> _Config:
     """Reads and parses the config file.
 
-    If the config file doesn't exist, creates the default one.
+    If the config file doesn't exist, returns the default config (which is also what the default
+    config file contains) without creating the file.
+
+    The parsed config is kept in memory, and the file is only parsed again if its modification time
+    or size has changed.
 
-    Raises a ConfigAccessError if the config file cannot be accessed.
+    Raises a ConfigAccessError if the config file cannot be accessed or parsed.
     """
+    global _config_cache # pylint: disable=global-statement
+
+    try:
+        config_stat = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        return _Config()
+    except OSError as e:
+        raise ConfigAccessError(f"Could not read config file {CONFIG_PATH}") from e
+
+    stamp = (config_stat.st_mtime_ns, config_stat.st_size)
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
 
-    ensure_config_file()
-    parser = ConfigParser()
     try:
         with open(CONFIG_PATH, "r", encoding="utf-8") as file:
-            parser.read_string("[DEFAULT]\n" + file.read())
+            values = _parse_config(file)
     except OSError as e:
         raise ConfigAccessError(f"Could not read config file {CONFIG_PATH}") from e
+    except ValueError as e:
+        raise ConfigAccessError(f"Could not parse config file {CONFIG_PATH}") from e
 
-    return _Config(
-        mineways_cmd = parser.get("DEFAULT", "mineways-cmd", fallback=None),
-        blender_cmd  = parser.get("DEFAULT", "blender-cmd",  fallback=None),
+    config = _Config(
+        mineways_cmd = values.get("mineways-cmd"),
+        blender_cmd  = values.get("blender-cmd"),
     )
+    _config_cache = (stamp, config)
+    return config
 
 
 # --------------------------------------------------------------------------------------------------
 # Mineways
 
 
+# https://www.realtimerendering.com/erich/minecraft/public/mineways/scripting.html
+_MINEWAYS_SCRIPT_TEMPLATE = (
+    "Save Log file: {log_path}\n"
+    "Minecraft world: {world_path}\n"
+    "View {view}\n"
+    "Selection location min to max: {x1}, {y1}, {z1} to {x2}, {y2}, {z2}\n"
+    "Set render type: Wavefront OBJ absolute indices\n"
+    "File type: Export all textures to three large images\n"
+    "Rotate model {degrees} degrees\n"
+    "Scale model by making each block 100 cm high\n"
+    "Tree leaves solid: yes\n"
+    "Use biomes: yes\n"
+    "Export for Rendering: {output_path}\n"
+    "Close\n"
+)
+
+
+def _check_snippet_args(size_x: int, size_y: int, size_z: int, rotation: int, dimension: str):
+    """Raises a ValueError if the snippet size, rotation or dimension is invalid."""
+
+    if size_x <= 0 or size_y <= 0 or size_z <= 0:
+        raise ValueError("The size must be positive in each dimension.")
+
+    if rotation not in (0, 1, 2, 3):
+        raise ValueError("The rotation must be 0, 1, 2 or 3.")
+
+    if dimension not in _DIMENSION_ID_TO_MINEWAYS_NAME:
+        raise ValueError(f"The dimension must be one of {{{', '.join(DIMENSIONS)}}}.")
+
+
+def _resolve_mineways_cmd(mineways_cmd: Optional[str]) -> str:
+    """Returns <mineways_cmd>, or the command from the config file if it is None.
+
+    Raises a `MinewaysCommandNotSetError` if the command is set in neither, or a `ConfigAccessError`
+    if the config file cannot be accessed.
+    """
+    if mineways_cmd is None:
+        mineways_cmd = _read_config_file().mineways_cmd
+        if mineways_cmd is None:
+            raise MinewaysCommandNotSetError("The Mineways command is set neither in the config file nor as an argument.")
+    return mineways_cmd
+
+
 def mineways_make_obj(
     output_dir_path: str,
     output_name:     str,
@@ -179,79 +310,233 @@ def mineways_make_obj(
     May raise other exceptions as well, such as `OSError`.
     """
 
-    if size_x <= 0 or size_y <= 0 or size_z <= 0:
-        raise ValueError("The size must be positive in each dimension.")
+    _check_snippet_args(size_x, size_y, size_z, rotation, dimension)
+    mineways_cmd = _resolve_mineways_cmd(mineways_cmd)
 
-    if rotation not in (0, 1, 2, 3):
-        raise ValueError("The rotation must be 0, 1, 2 or 3.")
+    with TemporaryDirectory() as tmpDir:
+        _mineways_make_obj(tmpDir, output_dir_path, output_name, world_path, x, y, z, size_x, size_y, size_z, rotation, dimension, mineways_cmd)
 
-    if dimension not in DIMENSIONS:
-        raise ValueError(f"The dimension must be one of {{{', '.join(DIMENSIONS)}}}.")
 
-    if mineways_cmd is None:
-        mineways_cmd = _read_config_file().mineways_cmd
-        if mineways_cmd is None:
-            raise MinewaysCommandNotSetError("The Mineways command is set neither in the config file nor as an argument.")
+def _mineways_make_obj(
+    work_dir_path:   str,
+    output_dir_path: str,
+    output_name:     str,
+    world_path:      str,
+    x:               int,
+    y:               int,
+    z:               int,
+    size_x:          int,
+    size_y:          int,
+    size_z:          int,
+    rotation:        int,
+    dimension:       str,
+    mineways_cmd:    str
+):
+    """Implementation of `mineways_make_obj()`.
 
-    with TemporaryDirectory() as tmpDir:
-        scriptPath = f"{tmpDir}/script.mwscript"
-        logPath    = f"{tmpDir}/log.txt"
-
-        with open(scriptPath, "w", encoding="utf-8") as f:
-            # https://www.realtimerendering.com/erich/minecraft/public/mineways/scripting.html
-            f.write(f"Save Log file: {tmpDir}/log.txt\n")
-            f.write(f"Minecraft world: {world_path}\n")
-            f.write(f"View {_DIMENSION_ID_TO_MINEWAYS_NAME[dimension]}\n")
-            f.write(f"Selection location min to max: {x}, {y}, {z} to {x + size_x - 1}, {y + size_y - 1}, {z + size_z - 1}\n")
-            f.write("Set render type: Wavefront OBJ absolute indices\n")
-            f.write("File type: Export all textures to three large images\n")
-            f.write(f"Rotate model {rotation*90} degrees\n")
-            f.write("Scale model by making each block 100 cm high\n")
-            f.write("Tree leaves solid: yes\n")
-            f.write("Use biomes: yes\n")
-            f.write(f"Export for Rendering: {output_dir_path}/{output_name}.obj\n")
-            f.write("Close\n")
-
-        os.makedirs(output_dir_path, exist_ok=True)
-
-        # If Mineways cannot find the world, it will write an error message to the log file, but it
-        # won't stop. There seems to be no command-line option to make it stop in this case, either.
-        # To handle this, we run Mineways in the background, periodically check the log file, and
-        # kill the process if we see the error message.
+    Writes the Mineways script and log to the existing directory <work_dir_path>.
+    """
 
-        try:
-            cmd = [mineways_cmd, "-m", "-suppress", "-s", "none", scriptPath]
-            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-        except OSError as e:
-            raise MinewaysLaunchError(f"Mineways could not be launched: {e}") from e
+    scriptPath = f"{work_dir_path}/script.mwscript"
+    logPath    = f"{work_dir_path}/log.txt"
+
+    with open(scriptPath, "w", encoding="utf-8") as f:
+        f.write(_MINEWAYS_SCRIPT_TEMPLATE.format(
+            log_path    = logPath,
+            world_path  = world_path,
+            view        = _DIMENSION_ID_TO_MINEWAYS_NAME[dimension],
+            x1          = x,
+            y1          = y,
+            z1          = z,
+            x2          = x + size_x - 1,
+            y2          = y + size_y - 1,
+            z2          = z + size_z - 1,
+            degrees     = rotation*90,
+            output_path = f"{output_dir_path}/{output_name}.obj",
+        ))
+
+    os.makedirs(output_dir_path, exist_ok=True)
+
+    # If Mineways cannot find the world, it will write an error message to the log file, but it
+    # won't stop. There seems to be no command-line option to make it stop in this case, either.
+    # To handle this, we run Mineways in the background, periodically check the log file, and
+    # kill the process if we see the error message.
 
+    try:
+        cmd = [mineways_cmd, "-m", "-suppress", "-s", "none", scriptPath]
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+    except OSError as e:
+        raise MinewaysLaunchError(f"Mineways could not be launched: {e}") from e
+
+    # We keep the log file open and only scan the bytes that were added since the previous
+    # check. The last line may still be incomplete, so we keep it and scan it again together
+    # with whatever is appended to it.
+
+    log_file    = None
+    log_partial = b""
+    try:
         while True:
-            if process.poll() is not None:
-                if process.returncode != 0:
-                    raise MinewaysError(f"Mineways returned an error ({process.returncode})")
-                break
+            if log_file is None:
+                try:
+                    log_file = open(logPath, "rb", buffering=0) # pylint: disable=consider-using-with
+                except FileNotFoundError:
+                    pass
+            if log_file is not None:
+                *lines, log_partial = (log_partial + log_file.read()).split(b"\n")
+                for line in (*lines, log_partial):
+                    if line.startswith(b"Error reading line 2: Mineways attempted to load world"):
+                        process.kill()
+                        raise MinewaysBadWorldError(f"Mineways could not load the world {repr(world_path)}")
             try:
-                with open(logPath, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.startswith("Error reading line 2: Mineways attempted to load world"):
-                            process.kill()
-                            raise MinewaysBadWorldError(f"Mineways could not load the world {repr(world_path)}")
-            except FileNotFoundError:
-                pass
-            time.sleep(0.1)
+                process.wait(timeout=0.1)
+            except subprocess.TimeoutExpired:
+                continue
+            if process.returncode != 0:
+                raise MinewaysError(f"Mineways returned an error ({process.returncode})")
+            break
+    finally:
+        if log_file is not None:
+            log_file.close()
 
 
 # --------------------------------------------------------------------------------------------------
 # Blender
 
 
+def _check_output_path(output_path: str, force: bool):
+    """Raises an OutputFileExistsError if <output_path> cannot be written to.
+
+    Uses the same rules as `move()` with `never_overwrite_dir=True`.
+    """
+
+    try:
+        output_mode = os.stat(output_path).st_mode
+    except (OSError, ValueError):
+        return
+
+    if stat.S_ISDIR(output_mode):
+        raise OutputFileExistsError(f"Not overwriting directory {output_path}")
+    if not force and stat.S_ISREG(output_mode):
+        raise OutputFileExistsError(f"File {output_path} already exists.")
+
+
+# Must match the markers in the Blender script.
+_BLENDER_SERVER_DONE_MARKER  = "<<mcrender-job-done>>"
+_BLENDER_SERVER_ERROR_MARKER = "<<mcrender-job-error>>"
+
+
+class _BlenderWorker:
+    """A Blender process that keeps running and renders jobs sent to it over stdin.
+
+    Starting Blender and loading the blend file can take longer than the render itself, so reusing a
+    single process for multiple renders can save a lot of time. There is at most one worker per
+    Blender command; use `_BlenderWorker.get()` to obtain it.
+    """
+
+    _workers: Dict[str, "_BlenderWorker"] = {}
+    _workers_lock = threading.Lock()
+
+    def __init__(self, blender_cmd: str):
+        try:
+            cmd = [blender_cmd, "--background", _BLENDER_BLEND_PATH, "--python", _BLENDER_SCRIPT_PATH, "--", "--server"]
+            self._process = subprocess.Popen( # pylint: disable=consider-using-with
+                cmd,
+                stdin    = subprocess.PIPE,
+                stdout   = subprocess.PIPE,
+                stderr   = subprocess.DEVNULL,
+                encoding = "utf-8",
+                errors   = "replace",
+            )
+        except OSError as e:
+            raise BlenderLaunchError(f"Blender could not be launched: {e}") from e
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, blender_cmd: str) -> "_BlenderWorker":
+        """Returns the worker for <blender_cmd>, launching it if it isn't running."""
+        with cls._workers_lock:
+            worker = cls._workers.get(blender_cmd)
+            if worker is None or not worker.is_alive():
+                if worker is not None:
+                    worker.close()
+                worker = cls(blender_cmd)
+                cls._workers[blender_cmd] = worker
+            return worker
+
+    @classmethod
+    def close_all(cls):
+        """Stops all workers."""
+        with cls._workers_lock:
+            for worker in cls._workers.values():
+                worker.close()
+            cls._workers.clear()
+
+    def is_alive(self) -> bool:
+        """Returns whether the Blender process is still running."""
+        return self._process.poll() is None
+
+    def render(self, obj_path: str, output_path: str, exposure: float):
+        """Renders <obj_path> like the Blender script would when run without --server.
+
+        Raises a `BlenderError` if the render fails or if Blender exits.
+        """
+
+        job = {"obj_path": os.path.abspath(obj_path), "output_path": os.path.abspath(output_path), "exposure": exposure}
+        with self._lock:
+            try:
+                self._process.stdin.write(json.dumps(job) + "\n")
+                self._process.stdin.flush()
+            except OSError as e:
+                raise BlenderError(f"Blender exited unexpectedly ({self._process.wait()})") from e
+
+            # Blender writes its own output to stdout as well, so we search for the markers.
+            for line in self._process.stdout:
+                if _BLENDER_SERVER_DONE_MARKER in line:
+                    return
+                if _BLENDER_SERVER_ERROR_MARKER in line:
+                    message = line.split(_BLENDER_SERVER_ERROR_MARKER, 1)[1].strip()
+                    raise BlenderError(f"Blender returned an error: {message}")
+            raise BlenderError(f"Blender exited unexpectedly ({self._process.wait()})")
+
+    def close(self):
+        """Stops the Blender process."""
+        with self._lock:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process.stdout.close()
+
+
+atexit.register(_BlenderWorker.close_all)
+
+
+def _resolve_blender_cmd(blender_cmd: Optional[str]) -> str:
+    """Returns <blender_cmd>, or the command from the config file if it is None.
+
+    Raises a `BlenderCommandNotSetError` if the command is set in neither, or a `ConfigAccessError`
+    if the config file cannot be accessed.
+    """
+    if blender_cmd is None:
+        blender_cmd = _read_config_file().blender_cmd
+        if blender_cmd is None:
+            raise BlenderCommandNotSetError("The Blender command is set neither in the config file nor as an argument.")
+    return blender_cmd
+
+
 def blender_render_obj(
     output_path: str,
     obj_path:    str,
     exposure:    float = 0,
     trim:        bool  = True,
     force:       bool  = False,
-    blender_cmd: Optional[str] = None
+    blender_cmd: Optional[str] = None,
+    persistent:  bool  = False,
 ):
     """Renders an OBJ file (as created by Mineways) to a PNG image using Blender.
 
@@ -268,6 +553,10 @@ def blender_render_obj(
     Uses <blender_cmd> to run Blender. If <blender_cmd> is None, uses the command defined in the
     config file.
 
+    If <persistent> is true, the render is done by a Blender process that is kept running for later
+    calls with the same Blender command, which saves Blender's startup time on each of them. The
+    process is stopped when the Python interpreter exits.
+
     Raises:
     - `ConfigAccessError` if the config file cannot be accessed.
     - `BlenderCommandNotSetError` if the Blender command is set neither in the config file nor as an
@@ -279,31 +568,204 @@ def blender_render_obj(
     May raise other exceptions as well, such as `OSError`.
     """
 
-    if blender_cmd is None:
-        blender_cmd = _read_config_file().blender_cmd
-        if blender_cmd is None:
-            raise BlenderCommandNotSetError("The Blender command is set neither in the config file nor as an argument.")
+    blender_cmd = _resolve_blender_cmd(blender_cmd)
 
     with TemporaryDirectory() as tmpDir:
+        _blender_render_obj(tmpDir, output_path, obj_path, exposure, trim, force, blender_cmd, persistent)
+
+
+def _blender_render_obj(
+    work_dir_path: str,
+    output_path:   str,
+    obj_path:      str,
+    exposure:      float,
+    trim:          bool,
+    force:         bool,
+    blender_cmd:   str,
+    persistent:    bool
+):
+    """Implementation of `blender_render_obj()`.
+
+    Lets Blender write its output to the existing directory <work_dir_path>.
+    """
+
+    # When trimming, the output file is put in place with os.replace, which always overwrites, so we
+    # check it up front. This also avoids a pointless render when the output file cannot be written.
+    _check_output_path(output_path, force)
+
+    if persistent:
+        _BlenderWorker.get(blender_cmd).render(obj_path, f"{work_dir_path}/output", exposure)
+    else:
         try:
-            cmd  = [blender_cmd, "--background", _BLENDER_BLEND_PATH, "--python", _BLENDER_SCRIPT_PATH, "--", "--exposure", str(exposure), obj_path, f"{tmpDir}/output"]
+            cmd  = [blender_cmd, "--background", _BLENDER_BLEND_PATH, "--python", _BLENDER_SCRIPT_PATH, "--", "--exposure", str(exposure), obj_path, f"{work_dir_path}/output"]
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
         except OSError as e:
             raise BlenderLaunchError(f"Blender could not be launched: {e}") from e
         except subprocess.CalledProcessError as e:
             raise BlenderError(f"Blender returned an error: {e}") from e
 
-        if trim:
-            with Image.open(f"{tmpDir}/output0001.png") as image:
-                trimmed = image.crop(image.getbbox())
-            trimmed.save(f"{tmpDir}/output0001.png")
+    output_dir_path = os.path.dirname(output_path)
+    if output_dir_path: os.makedirs(output_dir_path, exist_ok=True)
+
+    if trim:
+        from PIL import Image # pylint: disable=import-outside-toplevel
+        with Image.open(f"{work_dir_path}/output0001.png") as image:
+            # The background is transparent, so the model's bounding box is that of the alpha
+            # channel, which is cheaper to scan than all channels together.
+            if "A" in image.getbands():
+                bbox = image.getchannel("A").getbbox()
+            else:
+                bbox = image.getbbox()
+            trimmed = image.crop(bbox)
+        # Save next to the output file and then replace it, so that a failed save never leaves a
+        # truncated image at <output_path>.
+        tmpPath = os.path.join(output_dir_path, f".{os.path.basename(output_path)}.{os.urandom(8).hex()}.tmp")
+        try:
+            with open(tmpPath, "xb") as file:
+                trimmed.save(file, format="PNG")
+            os.replace(tmpPath, output_path)
+        finally:
+            try:
+                os.remove(tmpPath)
+            except FileNotFoundError:
+                pass
+    else:
+        try:
+            move(f"{work_dir_path}/output0001.png", output_path, overwrite=force, never_overwrite_dir=True)
+        except FileExistsError as e:
+            raise OutputFileExistsError(str(e)) from e
+
+
+# --------------------------------------------------------------------------------------------------
+# Render cache
+
+
+def _render_cache_enabled() -> bool:
+    """Returns whether the render cache is enabled.
+
+    The cache can be disabled by setting the environment variable MCRENDER_DISABLE_CACHE to a
+    non-empty value.
+    """
+    return not os.environ.get("MCRENDER_DISABLE_CACHE")
+
+
+def _render_cache_max_bytes() -> int:
+    """Returns the size in bytes above which the render cache evicts renders.
+
+    The size can be set in MiB with the environment variable MCRENDER_CACHE_MAX_MB. If the variable
+    is not set or is not a non-negative integer, the default of 512 MiB is used.
+    """
+    try:
+        max_mb = int(os.environ.get("MCRENDER_CACHE_MAX_MB", ""))
+    except ValueError:
+        max_mb = -1
+    if max_mb < 0:
+        max_mb = _RENDER_CACHE_DEFAULT_MAX_MB
+    return max_mb * 1024 * 1024
+
+
+def _render_cache_path(
+    world_path:   str,
+    x:            int,
+    y:            int,
+    z:            int,
+    size_x:       int,
+    size_y:       int,
+    size_z:       int,
+    rotation:     int,
+    dimension:    str,
+    exposure:     float,
+    trim:         bool,
+    mineways_cmd: str,
+    blender_cmd:  str
+) -> str:
+    """Returns the path at which the render with the specified arguments is cached.
+
+    The path is derived from the arguments (including the resolved commands) and from the size and
+    modification time of the region files that the snippet intersects, so that a render is no longer
+    found when that part of the world changes. Only the files' metadata is read, not their contents.
+    """
+
+    key = hashlib.blake2b(digest_size=16)
+    key.update(repr((__version__, os.path.abspath(world_path), x, y, z, size_x, size_y, size_z, rotation, dimension, exposure, trim, mineways_cmd, blender_cmd)).encode("utf-8"))
+
+    # Each region file covers 512x512 blocks.
+    region_dir_path = os.path.join(world_path, _DIMENSION_ID_TO_REGION_DIR[dimension])
+    for region_x in range(x >> 9, ((x + size_x - 1) >> 9) + 1):
+        for region_z in range(z >> 9, ((z + size_z - 1) >> 9) + 1):
+            try:
+                region_stat = os.stat(os.path.join(region_dir_path, f"r.{region_x}.{region_z}.mca"))
+                key.update(f"{region_x},{region_z},{region_stat.st_size},{region_stat.st_mtime_ns}\n".encode("utf-8"))
+            except (FileNotFoundError, NotADirectoryError):
+                key.update(f"{region_x},{region_z},missing\n".encode("utf-8"))
+
+    return os.path.join(_RENDER_CACHE_DIR, f"{key.hexdigest()}.png")
+
+
+def _render_cache_fetch(cache_path: str, output_path: str, force: bool) -> bool:
+    """Copies the cached render at <cache_path> to <output_path>, if it exists.
+
+    Returns whether the cached render could be read. Like `_render_cache_store()`, treats any
+    failure to access the cache as a miss: the cache is only an optimization.
+
+    Raises an OutputFileExistsError if the output file already exists and <force> is false.
+    """
+
+    with TemporaryDirectory() as tmpDir:
+        try:
+            shutil.copyfile(cache_path, f"{tmpDir}/output.png")
+        except OSError:
+            return False
+
+        # Touch the cached render, so that eviction removes the least recently used renders.
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
 
-        if os.path.dirname(output_path): os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        output_dir_path = os.path.dirname(output_path)
+        if output_dir_path: os.makedirs(output_dir_path, exist_ok=True)
         try:
-            move(f"{tmpDir}/output0001.png", output_path, overwrite=force, never_overwrite_dir=True)
+            move(f"{tmpDir}/output.png", output_path, overwrite=force, never_overwrite_dir=True)
         except FileExistsError as e:
             raise OutputFileExistsError(str(e)) from e
 
+    return True
+
+
+def _render_cache_store(cache_path: str, output_path: str):
+    """Stores a copy of the render at <output_path> in the cache at <cache_path>.
+
+    Evicts the least recently used renders if the cache grows too large.
+    Failures are ignored: the cache is only an optimization.
+    """
+
+    try:
+        os.makedirs(_RENDER_CACHE_DIR, exist_ok=True)
+        fd, tmpPath = mkstemp(dir=_RENDER_CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(output_path, tmpPath)
+            os.replace(tmpPath, cache_path)
+        except OSError:
+            os.remove(tmpPath)
+            raise
+
+        max_bytes = _render_cache_max_bytes()
+        with os.scandir(_RENDER_CACHE_DIR) as it:
+            entries = [(entry.stat(), entry.path) for entry in it if entry.name.endswith(".png")]
+        total_size = sum(entry_stat.st_size for entry_stat, _ in entries)
+        for entry_stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime_ns):
+            if total_size <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= entry_stat.st_size
+    except OSError:
+        pass
+
 
 # --------------------------------------------------------------------------------------------------
 # Mineways + Blender
@@ -326,6 +788,7 @@ def render(
     mineways_cmd: Optional[str] = None,
     blender_cmd:  Optional[str] = None,
     verbose:      bool  = False,
+    persistent:   bool  = False,
 ):
     """Renders a Minecraft world snippet to a PNG image using Mineways and Blender.
 
@@ -346,6 +809,15 @@ def render(
     Uses <mineways_cmd> to run Mineways and <blender_cmd> to run Blender.
     If either argument is None, uses the command defined in the config file.
 
+    If <persistent> is true, Blender is kept running for later calls (see `blender_render_obj()`).
+
+    Renders are cached in the user cache directory, keyed by the arguments, the Mineways and Blender
+    commands, and the state of the world's region files. If an identical render of an unchanged
+    world is cached, it is copied to <output_path> without running Mineways or Blender. The cache
+    cannot tell when the program behind an unchanged command is replaced, for example by upgrading
+    Blender in place. Set the environment variable MCRENDER_DISABLE_CACHE to a non-empty value to
+    disable the cache, and MCRENDER_CACHE_MAX_MB to change its size limit (512 MiB by default).
+
     Raises:
     - `ConfigAccessError` if the config file cannot be accessed.
     - `MinewaysCommandNotSetError` if the mineways command is set neither in the config file nor as
@@ -361,9 +833,102 @@ def render(
 
     May raise other exceptions as well, such as `OSError`.
     """
+    _render(output_path, world_path, x, y, z, size_x, size_y, size_z, rotation, dimension, exposure, trim, force, mineways_cmd, blender_cmd, verbose, persistent)
+
+
+def _render(
+    output_path:   str,
+    world_path:    str,
+    x:             int,
+    y:             int,
+    z:             int,
+    size_x:        int,
+    size_y:        int,
+    size_z:        int,
+    rotation:      int   = 0,
+    dimension:     str   = "overworld",
+    exposure:      float = 0,
+    trim:          bool  = True,
+    force:         bool  = False,
+    mineways_cmd:  Optional[str] = None,
+    blender_cmd:   Optional[str] = None,
+    verbose:       bool  = False,
+    persistent:    bool  = False,
+    mineways_slot: Optional[ContextManager] = None,
+    blender_slot:  Optional[ContextManager] = None,
+):
+    """Implementation of `render()`.
+
+    Runs Mineways inside <mineways_slot> and Blender inside <blender_slot>, if they are set. This
+    lets `render_batch()` limit how many of each run at the same time.
+    """
+    if mineways_slot is None: mineways_slot = nullcontext()
+    if blender_slot  is None: blender_slot  = nullcontext()
+
+    _check_snippet_args(size_x, size_y, size_z, rotation, dimension)
+
+    mineways_cmd = _resolve_mineways_cmd(mineways_cmd)
+    blender_cmd  = _resolve_blender_cmd(blender_cmd)
+
+    cache_path = None
+    if _render_cache_enabled():
+        cache_path = _render_cache_path(world_path, x, y, z, size_x, size_y, size_z, rotation, dimension, exposure, trim, mineways_cmd, blender_cmd)
+        if _render_cache_fetch(cache_path, output_path, force):
+            if verbose: eprint(f"Created {output_path} (from cache)")
+            return
+
+    # Fail before the Mineways export if the output file cannot be written.
+    _check_output_path(output_path, force)
+
+    # Mineways and Blender share one temporary directory. Their working files have different names,
+    # and the model is written to a subdirectory.
     with TemporaryDirectory() as tmpDir:
-        if verbose: eprint("Running Mineways...")
-        mineways_make_obj(tmpDir, "snippet", world_path, x, y, z, size_x, size_y, size_z, rotation, dimension, mineways_cmd)
-        if verbose: eprint("Rendering...")
-        blender_render_obj(output_path, f"{tmpDir}/snippet.obj", exposure, trim, force, blender_cmd)
+        with mineways_slot:
+            if verbose: eprint("Running Mineways...")
+            _mineways_make_obj(tmpDir, f"{tmpDir}/model", "snippet", world_path, x, y, z, size_x, size_y, size_z, rotation, dimension, mineways_cmd)
+        with blender_slot:
+            if verbose: eprint("Rendering...")
+            _blender_render_obj(tmpDir, output_path, f"{tmpDir}/model/snippet.obj", exposure, trim, force, blender_cmd, persistent)
         if verbose: eprint(f"Created {output_path}")
+
+    if cache_path is not None:
+        _render_cache_store(cache_path, output_path)
+
+
+async def render_async(*args, **kwargs):
+    """Asynchronous version of `render()`.
+
+    Runs `render()` in the default executor of the running event loop, so that multiple renders can
+    be awaited concurrently, for example with `asyncio.gather()`. Takes the same arguments and
+    raises the same exceptions as `render()`.
+    """
+    import asyncio # pylint: disable=import-outside-toplevel
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(render, *args, **kwargs))
+
+
+def render_batch(jobs: List[Dict[str, Any]], mineways_workers: int = 1, blender_workers: int = 1):
+    """Renders multiple Minecraft world snippets, overlapping the Mineways and Blender stages.
+
+    Each job is a dict of keyword arguments for `render()`. While Blender renders one snippet,
+    Mineways can already export the next one. At most <mineways_workers> Mineways processes and
+    <blender_workers> Blender renders run at the same time.
+
+    Waits until all jobs are done. If any of them failed, raises the exception of the first failed
+    job (in the order of <jobs>). Can raise the same exceptions as `render()`.
+    """
+
+    if mineways_workers < 1 or blender_workers < 1:
+        raise ValueError("The number of workers must be positive.")
+
+    mineways_slot = threading.Semaphore(mineways_workers)
+    blender_slot  = threading.Semaphore(blender_workers)
+
+    with ThreadPoolExecutor(max_workers=mineways_workers + blender_workers) as executor:
+        futures = [
+            executor.submit(_render, **job, mineways_slot=mineways_slot, blender_slot=blender_slot)
+            for job in jobs
+        ]
+
+    for future in futures:
+        future.result()
@@ -1,6 +1,6 @@
 """mcrender command-line interface."""
 
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 import sys
 
 from click import UsageError
@@ -30,15 +30,113 @@ def parse_box_spec(pos: Tuple[Tuple[int]], size: Optional[Tuple[int]]) -> Tuple[
         if size is not None:
             raise_box_spec_error()
 
-        x1, x2 = sorted((pos[0][0], pos[1][0]))
-        y1, y2 = sorted((pos[0][1], pos[1][1]))
-        z1, z2 = sorted((pos[0][2], pos[1][2]))
+        (ax, ay, az), (bx, by, bz) = pos
+
+        x1, x2 = min(ax, bx), max(ax, bx)
+        y1, y2 = min(ay, by), max(ay, by)
+        z1, z2 = min(az, bz), max(az, bz)
 
         return x1, y1, z1, x2 - x1 + 1, y2 - y1 + 1, z2 - z1 + 1
 
     raise_box_spec_error()
 
 
+class _ErrorContext(NamedTuple):
+    """The CLI state that error messages refer to."""
+    error_prefix: str
+    world_path:   str
+    mineways_cmd: Optional[str]
+    blender_cmd:  Optional[str]
+
+
+def _handle_generic_error(e: mcrender.MCRenderError, ctx: _ErrorContext):
+    eprint(f"{ctx.error_prefix}{e}")
+
+
+def _handle_config_access_error(e: mcrender.ConfigAccessError, ctx: _ErrorContext):
+    eprint(f"{ctx.error_prefix}{e}\n    {e.__cause__}")
+
+
+_COMMAND_NOT_SET_MESSAGE = (
+    "You must either set --{key}, or set {key} in\n"
+    "{config_path}."
+)
+
+_LAUNCH_HELP_SPECIFIED = (
+    "Make sure that you have downloaded {program} and that your specified\n"
+    "command ({cmd}) runs it."
+)
+
+_LAUNCH_HELP_CONFIGURED = (
+    "Make sure that you have downloaded {program} and that your configured\n"
+    "{key} (in {config_path}) runs it."
+)
+
+
+def _print_command_not_set_error(ctx: _ErrorContext, key: str):
+    eprint(ctx.error_prefix + _COMMAND_NOT_SET_MESSAGE.format(key=key, config_path=repr(mcrender.CONFIG_PATH)))
+
+
+def _print_launch_error(e: mcrender.MCRenderError, ctx: _ErrorContext, program: str, cmd: Optional[str], key: str):
+    eprint(f"{ctx.error_prefix}{program} could not be launched.\n    {e.__cause__}\n")
+    if cmd is not None:
+        eprint(_LAUNCH_HELP_SPECIFIED.format(program=program, cmd=repr(cmd)))
+    else:
+        eprint(_LAUNCH_HELP_CONFIGURED.format(program=program, key=key, config_path=repr(mcrender.CONFIG_PATH)))
+
+
+def _handle_mineways_command_not_set_error(_e: mcrender.MinewaysCommandNotSetError, ctx: _ErrorContext):
+    _print_command_not_set_error(ctx, "mineways-cmd")
+
+
+def _handle_blender_command_not_set_error(_e: mcrender.BlenderCommandNotSetError, ctx: _ErrorContext):
+    _print_command_not_set_error(ctx, "blender-cmd")
+
+
+def _handle_mineways_launch_error(e: mcrender.MinewaysLaunchError, ctx: _ErrorContext):
+    _print_launch_error(e, ctx, "Mineways", ctx.mineways_cmd, "mineways-cmd")
+
+
+def _handle_blender_launch_error(e: mcrender.BlenderLaunchError, ctx: _ErrorContext):
+    _print_launch_error(e, ctx, "Blender", ctx.blender_cmd, "blender-cmd")
+
+
+def _handle_mineways_bad_world_error(_e: mcrender.MinewaysBadWorldError, ctx: _ErrorContext):
+    eprint(
+        f"{ctx.error_prefix}Mineways could not load the specified world\n"
+        f"{repr(ctx.world_path)}.\n"
+        "\n"
+        "There might still be a Mineways window open that you'll have to close\n"
+        "manually. Sorry about that, I'm afraid I don't know how to prevent it."
+    )
+
+
+def _handle_blender_error(e: mcrender.BlenderError, ctx: _ErrorContext):
+    # Errors from a persistent Blender worker have no cause, but carry the message themselves.
+    eprint(f"{ctx.error_prefix}Blender returned an error.\n    {e.__cause__ if e.__cause__ is not None else e}")
+
+
+_ERROR_HANDLERS: Dict[type, Callable[[Any, _ErrorContext], None]] = {
+    mcrender.MCRenderError:              _handle_generic_error,
+    mcrender.ConfigAccessError:          _handle_config_access_error,
+    mcrender.MinewaysCommandNotSetError: _handle_mineways_command_not_set_error,
+    mcrender.BlenderCommandNotSetError:  _handle_blender_command_not_set_error,
+    mcrender.MinewaysLaunchError:        _handle_mineways_launch_error,
+    mcrender.BlenderLaunchError:         _handle_blender_launch_error,
+    mcrender.MinewaysBadWorldError:      _handle_mineways_bad_world_error,
+    mcrender.BlenderError:               _handle_blender_error,
+}
+
+
+def _handle_error(e: mcrender.MCRenderError, ctx: _ErrorContext):
+    """Prints an error message for <e>, using the handler of its most specific class."""
+    for cls in type(e).__mro__:
+        handler = _ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            handler(e, ctx)
+            return
+
+
 # We have to take the position as an option instead of a positional argument,
 # because otherwise you need to use "--" to pass negative numbers, which is
 # quite unintuitive. For consistency, we take the size as an option as well.
@@ -100,58 +198,9 @@ def cli(world_path: str, output_path: str, pos: Tuple[Tuple[int]], size: Optiona
             blender_cmd  = blender_cmd,
             verbose      = verbose
         )
-        return
-    except mcrender.ConfigAccessError as e:
-        eprint(f"{error_prefix}{e}\n    {e.__cause__}", file=sys.stderr)
-    except mcrender.MinewaysCommandNotSetError:
-        eprint(f"{error_prefix}You must either set --mineways-cmd, or set mineways-cmd in\n{repr(mcrender.CONFIG_PATH)}.")
-    except mcrender.BlenderCommandNotSetError:
-        eprint(f"{error_prefix}You must either set --blender-cmd, or set blender-cmd in\n{repr(mcrender.CONFIG_PATH)}.")
-    except mcrender.MinewaysLaunchError as e:
-        eprint(f"{error_prefix}Mineways could not be launched.\n    {e.__cause__}\n")
-        if mineways_cmd is not None:
-            eprint(
-                 "Make sure that you have downloaded Mineways and that your specified",
-                f"command ({repr(mineways_cmd)}) runs it.",
-                sep="\n"
-            )
-        else:
-            eprint(
-                "Make sure that you have downloaded Mineways and that your configured",
-                f"mineways-cmd (in {repr(mcrender.CONFIG_PATH)}) runs it.",
-                sep="\n"
-            )
-    except mcrender.BlenderLaunchError as e:
-        eprint(f"{error_prefix}Blender could not be launched.\n    {e.__cause__}\n")
-        if blender_cmd is not None:
-            eprint(
-                 "Make sure that you have downloaded Blender and that your specified",
-                f"command ({repr(blender_cmd)}) runs it.",
-                sep="\n"
-            )
-        else:
-            eprint(
-                "Make sure that you have downloaded Blender and that your configured",
-                f"blender-cmd (in {repr(mcrender.CONFIG_PATH)}) runs it.",
-                sep="\n"
-            )
-    except mcrender.MinewaysError as e:
-        eprint(f"{error_prefix}{e}")
-    except mcrender.MinewaysBadWorldError as e:
-        eprint(
-            f"{error_prefix}Mineways could not load the specified world",
-            f"{repr(world_path)}.",
-            "",
-            "There might still be a Mineways window open that you'll have to close",
-            "manually. Sorry about that, I'm afraid I don't know how to prevent it.",
-            sep="\n"
-        )
-    except mcrender.BlenderError as e:
-        eprint(f"{error_prefix}Blender returned an error.\n    {e.__cause__}")
-    except mcrender.OutputFileExistsError as e:
-        eprint(f"{error_prefix}{e}")
-
-    sys.exit(1)
+    except mcrender.MCRenderError as e:
+        _handle_error(e, _ErrorContext(error_prefix, world_path, mineways_cmd, blender_cmd))
+        sys.exit(1)
 
 
 def main():
@@ -2,6 +2,8 @@
 
 import sys
 import os
+import errno
+import stat
 import shutil
 
 
@@ -25,17 +27,27 @@ def move(src_path: str, dst_path: str, overwrite: bool = False, never_overwrite_
     If `overwrite==False`, changing `never_overwrite_dir` will only affect exception messages.
     """
 
-    if os.path.isfile(dst_path):
+    # One stat for both checks. Like os.path.isfile and os.path.isdir, we treat a path that cannot
+    # be stat'ed as nonexistent.
+    try:
+        dst_mode = os.stat(dst_path).st_mode
+    except (OSError, ValueError):
+        dst_mode = 0
+
+    if stat.S_ISREG(dst_mode):
         if not overwrite:
             raise FileExistsError(f"File {dst_path} already exists.")
+        # Unlike shutil.move, os.replace atomically overwrites on every OS, but it cannot move
+        # between file systems. In that case, shutil.move copies the file, which overwrites.
         try:
-            shutil.move(src_path, dst_path)
-        except FileExistsError:
-            os.remove(dst_path)
+            os.replace(src_path, dst_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
             shutil.move(src_path, dst_path)
         return
 
-    if os.path.isdir(dst_path):
+    if stat.S_ISDIR(dst_mode):
         if never_overwrite_dir:
             raise FileExistsError(f"Not overwriting directory {dst_path}")
         if not overwrite:
@@ -1,4 +1,6 @@
 import os
+import re
+import pathlib
 from setuptools import setup
 
 
@@ -7,21 +9,20 @@ METADATA_FILE_PATH = os.path.join(SCRIPT_DIR, "mcrender/__init__.py")
 
 
 # Based on https://github.com/pypa/pip/blob/9aa422da16e11b8e56d3597f34551f983ba9fbfd/setup.py
+# Matches lines of the form __{name}__ = "{value}"
+METADATA_RE = re.compile(r"""^__(?P<name>\w+)__\s*=\s*(?P<quote>["'])(?P<value>.*?)(?P=quote)""", re.MULTILINE)
+
 with open(METADATA_FILE_PATH) as file:
-    metadata_file_lines = file.read().splitlines()
+    metadata = {match["name"]: match["value"] for match in METADATA_RE.finditer(file.read())}
 
 def get_metadata(name: str) -> str:
-    for line in metadata_file_lines:
-        dunderString = f"__{name}__"
-        if line.startswith(f"{dunderString}"):
-            # __{name}__ = "{value}"
-            delim = '"' if '"' in line else "'"
-            return line.split(delim)[1]
-    raise RuntimeError(f"Unable to find {dunderString} value.")
+    try:
+        return metadata[name]
+    except KeyError:
+        raise RuntimeError(f"Unable to find __{name}__ value.") from None
 
 
-with open("README.md", "r", encoding="utf-8") as readme:
-    long_description = readme.read()
+long_description = pathlib.Path(SCRIPT_DIR, "README.md").read_text(encoding="utf-8")
 
 
 setup(